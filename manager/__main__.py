@@ -1,8 +1,12 @@
 """Unified CLI for image manager."""
 
+import os
 import shutil
 import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Iterator
 
 from manager.config import ConfigLoader
 from manager.models import ModelResolver
@@ -42,6 +46,7 @@ def print_usage() -> None:
     print()
     print("Generate options:")
     print("  --no-lock           Skip applying packages.lock (no version/digest pinning)")
+    print("  --force             Regenerate all outputs even if they are up-to-date")
     print()
     print("Build options:")
     print("  --no-cache          Disable S3 build cache")
@@ -75,6 +80,27 @@ def print_usage() -> None:
     print("  image-manager status")
 
 
+def _iter_image_ymls(root: str = "images") -> Iterator[str]:
+    """Find all image.yml files below root with an os.scandir walk.
+
+    Faster than Path.glob("**/image.yml") since it avoids per-entry Path
+    allocation and reuses the stat information from the directory read.
+    """
+    pending = deque([root])
+    while pending:
+        directory = pending.popleft()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name == "image.yml":
+                    yield entry.path
+
+
 def get_all_image_refs() -> list[str]:
     """Get all image references from dist/ directory in dependency order.
 
@@ -83,7 +109,7 @@ def get_all_image_refs() -> list[str]:
     # Load and resolve all images to get dependency order
     resolver = ModelResolver()
     all_images = []
-    for image_yaml in Path("images").glob("**/image.yml"):
+    for image_yaml in map(Path, _iter_image_ymls("images")):
         config = ConfigLoader.load(image_yaml)
         image = resolver.resolve(config, image_yaml.parent)
         all_images.append(image)
@@ -141,10 +167,229 @@ def expand_image_refs(refs: list[str]) -> list[str]:
     return expanded
 
 
+def _write_output(path: Path, text: str) -> None:
+    """Write a rendered file with a single buffered open/write/close."""
+    with open(path, "w", buffering=65536) as f:
+        f.write(text)
+
+
+def _write_alias(path: Path, tag_name: str) -> None:
+    """Write a tiny alias file without TextIOWrapper setup."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, tag_name.encode())
+    finally:
+        os.close(fd)
+
+
+# Stamp of the parameters the outputs in dist/ were last rendered with.
+# Outputs are only comparable by mtime when the parameters match; a
+# snapshot or lock toggle changes the rendered content without touching
+# any source file.
+_GENERATE_STAMP_PATH = Path("dist/.cache/generate.stamp")
+
+
+def _read_generate_stamp() -> str | None:
+    """Read the parameter stamp of the previous generate run."""
+    try:
+        return _GENERATE_STAMP_PATH.read_text()
+    except OSError:
+        return None
+
+
+def _write_generate_stamp(stamp: str) -> None:
+    """Persist the parameter stamp for the next run's freshness check."""
+    try:
+        _GENERATE_STAMP_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _GENERATE_STAMP_PATH.write_text(stamp)
+    except OSError:
+        pass
+
+
+def _image_sources_mtime(image) -> int:
+    """Latest mtime (ns) of the inputs feeding an image's rendered outputs.
+
+    Covers the image.yml, Dockerfile/test.yml templates, variant
+    templates, packages.lock and any rootfs content.
+    """
+    paths = [
+        image.path / "image.yml",
+        image.template_path,
+        image.test_config_path,
+        image.path / "packages.lock",
+    ]
+    paths += [variant.template_path for variant in image.variants]
+
+    # Rootfs files are copied into dist, so they are inputs too
+    rootfs_dirs = collect_rootfs_paths(image.path.parent, image.path, None)
+    for variant in image.variants:
+        rootfs_dirs += collect_rootfs_paths(image.path.parent, image.path, variant.name)
+    for rootfs_dir in set(rootfs_dirs):
+        paths += rootfs_dir.rglob("*")
+
+    mtime = 0
+    for path in paths:
+        try:
+            mtime = max(mtime, path.stat().st_mtime_ns)
+        except OSError:
+            continue
+    return mtime
+
+
+def _image_outputs_fresh(image, src_mtime: int) -> bool:
+    """Check whether every rendered output is newer than the sources."""
+    image_out_path = Path("dist") / image.name
+    tag_names = [tag.name for tag in image.tags]
+    tag_names += [variant_tag.name for variant in image.variants for variant_tag in variant.tags]
+
+    for tag_name in tag_names:
+        for filename in ("Dockerfile", "test.yml"):
+            try:
+                if (image_out_path / tag_name / filename).stat().st_mtime_ns < src_mtime:
+                    return False
+            except OSError:
+                return False
+    return True
+
+
+def _render_image(image, sorted_images: list, snapshot_id: str | None, use_lock: bool) -> list[str]:
+    """Render all tags and variant tags for a single image.
+
+    Returns warning lines instead of printing them directly so output
+    stays readable when images render in parallel worker processes.
+    """
+    dist_path = Path("dist")
+    image_out_path = dist_path.joinpath(image.name)
+    warnings: list[str] = []
+
+    # Check lock file once per image
+    lock_path = image.path / "packages.lock"
+    has_lock = lock_path.exists()
+    if use_lock and not has_lock:
+        warnings.append(f"Warning: No packages.lock for {image.name}, build may not be reproducible")
+
+    # Create all output directories in one sweep up-front
+    out_tag_names = [tag.name for tag in image.tags]
+    out_tag_names += [variant_tag.name for variant in image.variants for variant_tag in variant.tags]
+    for tag_name in out_tag_names:
+        image_out_path.joinpath(tag_name).mkdir(parents=True, exist_ok=True)
+
+    # Render base tags
+    for tag in image.tags:
+        tag_out_path = image_out_path.joinpath(tag.name)
+
+        # Collect and merge rootfs
+        rootfs_paths = collect_rootfs_paths(
+            image_path=image.path.parent,  # images/python
+            version_path=image.path,        # images/python/3
+            variant_name=None
+        )
+        has_rootfs = has_rootfs_content(rootfs_paths)
+
+        if has_rootfs:
+            merged_rootfs = tag_out_path / "rootfs"
+            merge_rootfs(rootfs_paths, merged_rootfs)
+            # Warn about sensitive files
+            warnings.extend(warn_sensitive_files(merged_rootfs))
+
+        ctx = RenderContext(
+            image=image,
+            all=sorted_images,
+            tag=tag,
+            variant=None,
+            snapshot_id=snapshot_id,
+            has_rootfs=has_rootfs
+        )
+
+        rendered_dockerfile = render_dockerfile(ctx)
+
+        # Apply lock file if enabled and exists
+        if use_lock and has_lock:
+            # Determine base ref from rendered Dockerfile
+            base_info = extract_base_image(rendered_dockerfile)
+            base_ref = f"{base_info[0]}:{base_info[1]}" if base_info else None
+
+            locked_packages = read_lock_file(lock_path, base_ref)
+            if locked_packages:
+                rendered_dockerfile = rewrite_apt_install(rendered_dockerfile, locked_packages)
+
+            base_digest_info = read_base_digest(lock_path, base_ref)
+            if base_digest_info:
+                original_ref, digest = base_digest_info
+                rendered_dockerfile = rewrite_from_digest(rendered_dockerfile, original_ref, digest)
+
+        _write_output(tag_out_path.joinpath("Dockerfile"), rendered_dockerfile)
+
+        rendered_test_config = render_test_config(ctx)
+        _write_output(tag_out_path.joinpath("test.yml"), rendered_test_config)
+
+    # Render variant tags
+    for variant in image.variants:
+        for variant_tag in variant.tags:
+            variant_out_path = image_out_path.joinpath(variant_tag.name)
+
+            # Collect and merge rootfs (including variant-specific)
+            rootfs_paths = collect_rootfs_paths(
+                image_path=image.path.parent,
+                version_path=image.path,
+                variant_name=variant.name
+            )
+            has_rootfs = has_rootfs_content(rootfs_paths)
+
+            if has_rootfs:
+                merged_rootfs = variant_out_path / "rootfs"
+                merge_rootfs(rootfs_paths, merged_rootfs)
+                warnings.extend(warn_sensitive_files(merged_rootfs))
+
+            ctx = RenderContext(
+                image=image,
+                all=sorted_images,
+                tag=variant_tag,
+                variant=variant,
+                snapshot_id=snapshot_id,
+                has_rootfs=has_rootfs
+            )
+
+            rendered_dockerfile = render_dockerfile(ctx)
+
+            # Apply lock file if enabled and exists
+            # Variants use the same lock file as the base image
+            if use_lock and has_lock:
+                # Determine base ref from rendered Dockerfile
+                base_info = extract_base_image(rendered_dockerfile)
+                base_ref = f"{base_info[0]}:{base_info[1]}" if base_info else None
+
+                locked_packages = read_lock_file(lock_path, base_ref)
+                if locked_packages:
+                    rendered_dockerfile = rewrite_apt_install(rendered_dockerfile, locked_packages)
+
+                base_digest_info = read_base_digest(lock_path, base_ref)
+                if base_digest_info:
+                    original_ref, digest = base_digest_info
+                    rendered_dockerfile = rewrite_from_digest(rendered_dockerfile, original_ref, digest)
+
+            _write_output(variant_out_path.joinpath("Dockerfile"), rendered_dockerfile)
+
+            rendered_test_config = render_test_config(ctx)
+            _write_output(variant_out_path.joinpath("test.yml"), rendered_test_config)
+
+    # Write base aliases
+    for alias, tag_name in image.aliases.items():
+        _write_alias(image_out_path.joinpath(alias), tag_name)
+
+    # Write variant aliases
+    for variant in image.variants:
+        for alias, tag_name in variant.aliases.items():
+            _write_alias(image_out_path.joinpath(alias), tag_name)
+
+    return warnings
+
+
 def cmd_generate(args: list[str]) -> int:
     """Generate Dockerfiles and test configs."""
     snapshot_id = None
     use_lock = True
+    force = False
 
     # Parse options
     i = 0
@@ -155,20 +400,22 @@ def cmd_generate(args: list[str]) -> int:
         elif args[i] == "--no-lock":
             use_lock = False
             i += 1
+        elif args[i] == "--force":
+            force = True
+            i += 1
         elif args[i].startswith("--"):
             print(f"Unknown argument: {args[i]}", file=sys.stderr)
             return 1
         else:
             i += 1
 
-    dist_path = Path("dist")
     # Don't clear dist - preserve built artifacts (image.tar, sbom, etc.)
     # Just overwrite Dockerfile, test.yml, index.html, aliases
 
     # Load and resolve all images
     resolver = ModelResolver()
     all_images = []
-    for image_yaml in Path("images").glob("**/image.yml"):
+    for image_yaml in map(Path, _iter_image_ymls("images")):
         config = ConfigLoader.load(image_yaml)
         image = resolver.resolve(config, image_yaml.parent)
         all_images.append(image)
@@ -194,133 +441,50 @@ def cmd_generate(args: list[str]) -> int:
             print(f"  {i}. {image.name} (no dependencies)")
     print()
 
-    for image in sorted_images:
-        image_out_path = dist_path.joinpath(image.name)
-
-        # Check lock file once per image
-        lock_path = image.path / "packages.lock"
-        has_lock = lock_path.exists()
-        if use_lock and not has_lock:
-            print(f"Warning: No packages.lock for {image.name}, build may not be reproducible", file=sys.stderr)
-
-        # Render base tags
-        for tag in image.tags:
-            tag_out_path = image_out_path.joinpath(tag.name)
-            tag_out_path.mkdir(parents=True, exist_ok=True)
-
-            # Collect and merge rootfs
-            rootfs_paths = collect_rootfs_paths(
-                image_path=image.path.parent,  # images/python
-                version_path=image.path,        # images/python/3
-                variant_name=None
-            )
-            has_rootfs = has_rootfs_content(rootfs_paths)
-
-            if has_rootfs:
-                merged_rootfs = tag_out_path / "rootfs"
-                merge_rootfs(rootfs_paths, merged_rootfs)
-                # Warn about sensitive files
-                for warning in warn_sensitive_files(merged_rootfs):
+    # Skip images whose outputs are newer than their sources. A stale
+    # upstream image invalidates its consumers, and snapshot builds embed
+    # the id into rendered FROM refs so they always re-render. The mtime
+    # comparison is only valid if the last run used the same parameters:
+    # a different snapshot id or lock mode changed the rendered content
+    # without touching any source, so everything is stale then.
+    params_stamp = f"snapshot_id={snapshot_id or ''}\nuse_lock={use_lock}\n"
+    if force or snapshot_id is not None or _read_generate_stamp() != params_stamp:
+        stale_images = sorted_images
+    else:
+        stale_names: set[str] = set()
+        stale_images = []
+        for image in sorted_images:
+            deps = dependencies.get(image.name, set())
+            if deps & stale_names or not _image_outputs_fresh(image, _image_sources_mtime(image)):
+                stale_names.add(image.name)
+                stale_images.append(image)
+
+        skipped = len(sorted_images) - len(stale_images)
+        if skipped:
+            print(f"Skipping {skipped} up-to-date image(s), use --force to regenerate")
+
+    # Rendering only reads resolved models and templates, so images are
+    # independent of each other and can render in parallel worker processes
+    if len(stale_images) > 1:
+        with ProcessPoolExecutor(max_workers=min(len(stale_images), os.cpu_count() or 1)) as executor:
+            futures = [
+                executor.submit(_render_image, image, sorted_images, snapshot_id, use_lock)
+                for image in stale_images
+            ]
+            for future in futures:
+                for warning in future.result():
                     print(warning, file=sys.stderr)
-
-            ctx = RenderContext(
-                image=image,
-                all=sorted_images,
-                tag=tag,
-                variant=None,
-                snapshot_id=snapshot_id,
-                has_rootfs=has_rootfs
-            )
-
-            rendered_dockerfile = render_dockerfile(ctx)
-
-            # Apply lock file if enabled and exists
-            if use_lock and has_lock:
-                # Determine base ref from rendered Dockerfile
-                base_info = extract_base_image(rendered_dockerfile)
-                base_ref = f"{base_info[0]}:{base_info[1]}" if base_info else None
-
-                locked_packages = read_lock_file(lock_path, base_ref)
-                if locked_packages:
-                    rendered_dockerfile = rewrite_apt_install(rendered_dockerfile, locked_packages)
-
-                base_digest_info = read_base_digest(lock_path, base_ref)
-                if base_digest_info:
-                    original_ref, digest = base_digest_info
-                    rendered_dockerfile = rewrite_from_digest(rendered_dockerfile, original_ref, digest)
-
-            tag_out_path.joinpath("Dockerfile").write_text(rendered_dockerfile)
-
-            rendered_test_config = render_test_config(ctx)
-            tag_out_path.joinpath("test.yml").write_text(rendered_test_config)
-
-        # Render variant tags
-        for variant in image.variants:
-            for variant_tag in variant.tags:
-                variant_out_path = image_out_path.joinpath(variant_tag.name)
-                variant_out_path.mkdir(parents=True, exist_ok=True)
-
-                # Collect and merge rootfs (including variant-specific)
-                rootfs_paths = collect_rootfs_paths(
-                    image_path=image.path.parent,
-                    version_path=image.path,
-                    variant_name=variant.name
-                )
-                has_rootfs = has_rootfs_content(rootfs_paths)
-
-                if has_rootfs:
-                    merged_rootfs = variant_out_path / "rootfs"
-                    merge_rootfs(rootfs_paths, merged_rootfs)
-                    for warning in warn_sensitive_files(merged_rootfs):
-                        print(warning, file=sys.stderr)
-
-                ctx = RenderContext(
-                    image=image,
-                    all=sorted_images,
-                    tag=variant_tag,
-                    variant=variant,
-                    snapshot_id=snapshot_id,
-                    has_rootfs=has_rootfs
-                )
-
-                rendered_dockerfile = render_dockerfile(ctx)
-
-                # Apply lock file if enabled and exists
-                # Variants use the same lock file as the base image
-                if use_lock and has_lock:
-                    # Determine base ref from rendered Dockerfile
-                    base_info = extract_base_image(rendered_dockerfile)
-                    base_ref = f"{base_info[0]}:{base_info[1]}" if base_info else None
-
-                    locked_packages = read_lock_file(lock_path, base_ref)
-                    if locked_packages:
-                        rendered_dockerfile = rewrite_apt_install(rendered_dockerfile, locked_packages)
-
-                    base_digest_info = read_base_digest(lock_path, base_ref)
-                    if base_digest_info:
-                        original_ref, digest = base_digest_info
-                        rendered_dockerfile = rewrite_from_digest(rendered_dockerfile, original_ref, digest)
-
-                variant_out_path.joinpath("Dockerfile").write_text(rendered_dockerfile)
-
-                rendered_test_config = render_test_config(ctx)
-                variant_out_path.joinpath("test.yml").write_text(rendered_test_config)
-
-        # Write base aliases
-        for alias, tag_name in image.aliases.items():
-            alias_out_path = image_out_path.joinpath(alias)
-            alias_out_path.write_text(tag_name)
-
-        # Write variant aliases
-        for variant in image.variants:
-            for alias, tag_name in variant.aliases.items():
-                alias_out_path = image_out_path.joinpath(alias)
-                alias_out_path.write_text(tag_name)
+    else:
+        for image in stale_images:
+            for warning in _render_image(image, sorted_images, snapshot_id, use_lock):
+                print(warning, file=sys.stderr)
 
     # Generate image catalog report
     report_path = generate_image_report(sorted_images, snapshot_id)
     print(f"Image catalog: {report_path}")
 
+    _write_generate_stamp(params_stamp)
+
     return 0
 
 
@@ -521,7 +685,7 @@ def cmd_manifest(args: list[str]) -> int:
 
 def cmd_test(args: list[str]) -> int:
     """Test an image or all images."""
-    from manager.testing import run_test, ensure_dind
+    from manager.testing import run_tests
     from manager.building import get_native_platform, platform_to_path
 
     config_path = None
@@ -573,32 +737,15 @@ def cmd_test(args: list[str]) -> int:
             print(f"Error: {e}", file=sys.stderr)
             return 1
 
-    # Start dind once for all tests
-    if not ensure_dind():
-        print("Error: Failed to start dind container", file=sys.stderr)
-        return 1
-
-    # Test each image
-    failed = []
-    for image_ref in image_refs:
-        print(f"\n{'='*60}")
-        print(f"Testing {image_ref}")
-        print(f"{'='*60}")
-        try:
-            result = run_test(image_ref, config_path, auto_start=False)
-            if result != 0:
-                failed.append(image_ref)
-        except (RuntimeError, FileNotFoundError, ValueError) as e:
-            print(f"Error: {e}", file=sys.stderr)
-            failed.append(image_ref)
-
-    if failed:
-        print(f"\nFailed tests: {', '.join(failed)}", file=sys.stderr)
+    # Run all tests as one batch: dind is started once, every tar is
+    # loaded up front and the test processes run in parallel
+    config_paths = {ref: config_path for ref in image_refs} if config_path else None
+    try:
+        return 1 if run_tests(image_refs, config_paths) != 0 else 0
+    except (RuntimeError, FileNotFoundError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
         return 1
 
-    print(f"\nAll {len(image_refs)} image(s) passed tests")
-    return 0
-
 
 def cmd_sbom(args: list[str]) -> int:
     """Generate SBOM for an image or all images."""
@@ -824,7 +971,7 @@ def cmd_generate_ci(args: list[str]) -> int:
     # Load and resolve all images
     resolver = ModelResolver()
     all_images = []
-    for image_yaml in Path("images").glob("**/image.yml"):
+    for image_yaml in map(Path, _iter_image_ymls("images")):
         config = ConfigLoader.load(image_yaml)
         image = resolver.resolve(config, image_yaml.parent)
         all_images.append(image)
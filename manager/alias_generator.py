@@ -1,16 +1,20 @@
 import re
+from functools import lru_cache
+
 from manager.models import Tag
 
 
 SEMVER_PATTERN = re.compile(r'^v?(\d+)\.(\d+)\.(\d+).*$')
 
 
+@lru_cache(maxsize=4096)
 def parse_semver(tag_name: str) -> tuple[int, int, int] | None:
     """
     Parse semantic version from tag name.
 
     Returns (major, minor, patch) tuple or None if not semver.
     Allows optional 'v' prefix and ignores any suffix after version.
+    Results are memoized since the same tag names recur across runs.
 
     Examples:
         "9.0.100" → (9, 0, 100)
@@ -18,6 +22,12 @@ def parse_semver(tag_name: str) -> tuple[int, int, int] | None:
         "3.13.7-beta" → (3, 13, 7)
         "latest" → None
     """
+    # Fast path: plain MAJOR.MINOR.PATCH tags skip the regex engine
+    parts = tag_name.split('.', 3)
+    if len(parts) == 3 and parts[0].isdigit() and parts[1].isdigit() and parts[2].isdigit():
+        return (int(parts[0]), int(parts[1]), int(parts[2]))
+
+    # Fallback for 'v' prefixes, suffixes and everything else
     match = SEMVER_PATTERN.match(tag_name)
     if not match:
         return None
@@ -44,56 +54,52 @@ def generate_semver_aliases(tags: list[Tag]) -> dict[str, str]:
         Tags: ["9.0.100", "9.0.200", "9.1.50"]
         Returns: {"9": "9.1.50", "9.0": "9.0.200", "9.1": "9.1.50"}
     """
+    # Aliases only depend on tag names, so memoize on those; copy the
+    # cached dict since callers extend it with variant aliases
+    return dict(_generate_semver_aliases_cached(tuple(tag.name for tag in tags)))
+
+
+@lru_cache(maxsize=None)
+def _generate_semver_aliases_cached(tag_names: tuple[str, ...]) -> dict[str, str]:
+    """Compute semver aliases for a tuple of tag names."""
     # Step 1: Parse tags into (version_tuple, tag_name, suffix) tuples
     parsed_tags = []
-    for tag in tags:
-        version = parse_semver(tag.name)
+    for tag_name in tag_names:
+        version = parse_semver(tag_name)
         if version:
             # Extract suffix from tag name
             major, minor, patch = version
             # Build the version string, accounting for optional 'v' prefix
-            tag_lower = tag.name
-            has_v = tag_lower.startswith('v')
+            has_v = tag_name.startswith('v')
             version_str = f"{major}.{minor}.{patch}"
 
-            # Find where version ends in the tag name
             if has_v:
                 search_str = f"v{version_str}"
             else:
                 search_str = version_str
 
-            idx = tag.name.find(search_str)
-            if idx >= 0:
-                suffix = tag.name[idx + len(search_str):]
+            # The tag starts with the version string unless it contains
+            # leading zeros the parse normalized away
+            if tag_name.startswith(search_str):
+                suffix = tag_name[len(search_str):]
             else:
                 suffix = ""
 
-            parsed_tags.append((version, tag.name, suffix))
+            parsed_tags.append((version, tag_name, suffix))
 
     if not parsed_tags:
         return {}  # No semver tags found
 
-    # Step 2: Group by prefixes (including suffix)
-    groups = {}
-    for (major, minor, patch), tag_name, suffix in parsed_tags:
+    # Step 2: Track the highest version per alias key in a single pass
+    # instead of grouping into lists and running max() per group
+    best: dict[str, tuple[tuple[int, int, int], str]] = {}
+    for version, tag_name, suffix in parsed_tags:
+        major, minor, _ = version
         # Major alias: "9" or "9-semantic" → highest 9.x.x
-        major_key = f"{major}{suffix}"
         # Major.minor alias: "9.0" or "9.0-semantic" → highest 9.0.x
-        minor_key = f"{major}.{minor}{suffix}"
-
-        if major_key not in groups:
-            groups[major_key] = []
-        groups[major_key].append(((major, minor, patch), tag_name))
-
-        if minor_key not in groups:
-            groups[minor_key] = []
-        groups[minor_key].append(((major, minor, patch), tag_name))
-
-    # Step 3: Find highest in each group
-    aliases = {}
-    for prefix, versions in groups.items():
-        # Sort by version tuple (lexicographic), take highest
-        highest = max(versions, key=lambda x: x[0])
-        aliases[prefix] = highest[1]  # tag_name
+        for key in (f"{major}{suffix}", f"{major}.{minor}{suffix}"):
+            current = best.get(key)
+            if current is None or current[0] < version:
+                best[key] = (version, tag_name)
 
-    return aliases
+    return {key: tag_name for key, (_, tag_name) in best.items()}
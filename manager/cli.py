@@ -43,11 +43,14 @@ class CLI:
         self.start_fn = start_fn
         self.stop_fn = stop_fn
         self.options: list[Option] = []
+        self._opts_by_name: dict[str, Option] = {}
         self.examples: list[str] = []
 
     def add_option(self, name: str, help: str, takes_value: bool = True) -> "CLI":
         """Add an option to the CLI."""
-        self.options.append(Option(name, help, takes_value))
+        option = Option(name, help, takes_value)
+        self.options.append(option)
+        self._opts_by_name[name] = option
         return self
 
     def add_example(self, example: str) -> "CLI":
@@ -118,7 +121,7 @@ class CLI:
             arg = args[i]
             if arg.startswith("--"):
                 opt_name = arg[2:]
-                opt = next((o for o in self.options if o.name == opt_name), None)
+                opt = self._opts_by_name.get(opt_name)
                 if opt is None:
                     print(f"Unknown option: {arg}", file=sys.stderr)
                     sys.exit(1)
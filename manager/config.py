@@ -2,17 +2,28 @@
 
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
-from pydantic import BaseModel
-from pydantic_yaml import parse_yaml_file_as
+from pydantic import BaseModel, TypeAdapter
+
+from manager.file_cache import config_cache
+
+try:
+    # libyaml-backed loader is several times faster than the pure-Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 _config_cache: dict | None = None
 
 CONFIG_FILE = ".image-manager.yml"
 DEFAULT_REGISTRY = "localhost:5050"
 
+# Matches ${VAR} references in config values
+_ENV_VAR_RE = re.compile(r'\$\{([^}]+)\}')
+
 
 class RegistryConfig:
     """Configuration for a single registry."""
@@ -53,6 +64,7 @@ def clear_config_cache() -> None:
     """Clear the config cache. Useful for testing."""
     global _config_cache
     _config_cache = None
+    _registry_index.cache_clear()
 
 
 def expand_env_vars(value: str | None) -> str | None:
@@ -68,28 +80,15 @@ def expand_env_vars(value: str | None) -> str | None:
     if value is None:
         return None
 
-    if not value:
-        return value
-
-    # Find all ${VAR} patterns
-    pattern = r'\$\{([^}]+)\}'
-    matches = list(re.finditer(pattern, value))
-
-    if not matches:
-        # No env var pattern found, return as-is
+    # Fast path: most config values contain no env var reference at all
+    if not value or '$' not in value:
         return value
 
-    # Expand all env vars
-    result = value
-    for match in reversed(matches):  # Reverse to preserve positions during replacement
-        var_name = match.group(1)
-        env_value = os.environ.get(var_name)
-        if env_value is None:
-            # Undefined env var - return None
-            return None
-        result = result[:match.start()] + env_value + result[match.end():]
-
-    return result
+    try:
+        return _ENV_VAR_RE.sub(lambda m: os.environ[m.group(1)], value)
+    except KeyError:
+        # Undefined env var - return None
+        return None
 
 
 def load_config() -> dict:
@@ -111,7 +110,7 @@ def load_config() -> dict:
 
     try:
         content = config_path.read_text()
-        _config_cache = yaml.safe_load(content) or {}
+        _config_cache = yaml.load(content, Loader=_YamlLoader) or {}
     except Exception:
         _config_cache = {}
 
@@ -250,6 +249,26 @@ def get_push_registry() -> RegistryConfig:
     return registries[0]
 
 
+@lru_cache(maxsize=1)
+def _registry_index() -> tuple[dict[str, "RegistryConfig"], list["RegistryConfig"]]:
+    """Index configured registries for prefix matching.
+
+    Returns a host -> registry dict for the common exact-host case plus
+    the registries sorted longest URL first, so the most specific prefix
+    wins in the fallback scan. Hosts shared by several registries map to
+    None: they must always go through the prefix scan so namespace-scoped
+    credentials beat the bare-host entry. Invalidated by
+    clear_config_cache().
+    """
+    registries = get_registries()
+    by_host: dict[str, "RegistryConfig | None"] = {}
+    for reg in registries:
+        host = reg.url.split("/")[0]
+        by_host[host] = None if host in by_host else reg
+    sorted_regs = sorted(registries, key=lambda reg: -len(reg.url))
+    return by_host, sorted_regs
+
+
 def get_registry_auth_for(registry_url: str) -> tuple[str, str] | None:
     """Get authentication credentials for a specific registry.
 
@@ -261,11 +280,23 @@ def get_registry_auth_for(registry_url: str) -> tuple[str, str] | None:
     Returns:
         (username, password) tuple if found, None otherwise
     """
-    registries = get_registries()
+    by_host, sorted_regs = _registry_index()
+
+    # Exact host match covers the common case without any scanning, but
+    # only when a single registry owns the host
+    host = registry_url.split("/", 1)[0]
+    reg = by_host.get(host)
+    if reg is not None:
+        return reg.get_auth()
+
+    for reg in sorted_regs:
+        # Match by URL prefix, most specific registry first
+        if registry_url.startswith(reg.url):
+            return reg.get_auth()
 
-    for reg in registries:
-        # Match by URL prefix
-        if registry_url.startswith(reg.url) or reg.url.startswith(registry_url.split("/")[0]):
+    for reg in sorted_regs:
+        # Fall back to any registry on the same host
+        if reg.url.startswith(host):
             return reg.get_auth()
 
     return None
@@ -452,10 +483,26 @@ class ImageConfig(BaseModel):
     licenses: str | None = None  # org.opencontainers.image.licenses (overrides global)
 
 
+# Shared validator - TypeAdapter compiles the core schema once, so
+# per-file validation only pays the validation cost itself
+_IMAGE_CONFIG_ADAPTER = TypeAdapter(ImageConfig)
+
+
 class ConfigLoader:
     """Loads and validates image.yml files"""
 
     @staticmethod
     def load(path: Path) -> ImageConfig:
-        """Load and validate an image.yml file"""
-        return parse_yaml_file_as(ImageConfig, path)
+        """Load and validate an image.yml file.
+
+        Parsed configs are cached on disk keyed by (mtime, size) so
+        unchanged files skip YAML parsing and validation on repeat runs.
+        """
+        cached = config_cache.get(path)
+        if cached is not None:
+            return cached
+
+        data = yaml.load(path.read_text(), Loader=_YamlLoader)
+        config = _IMAGE_CONFIG_ADAPTER.validate_python(data)
+        config_cache.set(path, config)
+        return config
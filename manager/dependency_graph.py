@@ -1,7 +1,7 @@
 import re
 from typing import Set
 from pathlib import Path
-from graphlib import TopologicalSorter
+from collections import deque
 
 
 class CyclicDependencyError(Exception):
@@ -70,6 +70,72 @@ def extract_dependencies(images: list) -> dict[str, Set[str]]:
     return dependencies
 
 
+def _tarjan_scc(graph: dict[str, Set[str]]) -> list[list[str]]:
+    """
+    Find strongly connected components with an iterative Tarjan DFS.
+
+    Only components that form actual cycles are returned: components
+    with more than one node, or single nodes depending on themselves.
+
+    Args:
+        graph: Dictionary mapping node to set of neighbor nodes
+
+    Returns:
+        List of cycles, each a sorted list of node names
+    """
+    counter = 0
+    indices: dict[str, int] = {}
+    lowlink: dict[str, int] = {}
+    stack: list[str] = []
+    on_stack: set[str] = set()
+    cycles: list[list[str]] = []
+
+    for root in graph:
+        if root in indices:
+            continue
+
+        work = [(root, iter(graph.get(root, ())))]
+        while work:
+            node, neighbors = work[-1]
+            if node not in indices:
+                indices[node] = lowlink[node] = counter
+                counter += 1
+                stack.append(node)
+                on_stack.add(node)
+
+            descended = False
+            for neighbor in neighbors:
+                if neighbor not in graph:
+                    continue
+                if neighbor not in indices:
+                    work.append((neighbor, iter(graph.get(neighbor, ()))))
+                    descended = True
+                    break
+                if neighbor in on_stack:
+                    lowlink[node] = min(lowlink[node], indices[neighbor])
+
+            if descended:
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+            if lowlink[node] == indices[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                if len(component) > 1 or node in graph.get(node, ()):
+                    cycles.append(sorted(component))
+
+    return cycles
+
+
 def topological_sort(dependencies: dict[str, Set[str]]) -> list[str]:
     """
     Perform topological sort on image dependencies.
@@ -85,17 +151,47 @@ def topological_sort(dependencies: dict[str, Set[str]]) -> list[str]:
     Raises:
         CyclicDependencyError: If a circular dependency is detected
     """
-    try:
-        # TopologicalSorter expects a mapping of node -> predecessors (dependencies)
-        sorter = TopologicalSorter(dependencies)
-        # static_order() returns a tuple in topological order
-        result = list(sorter.static_order())
-        return result
-    except ValueError as e:
-        # TopologicalSorter raises ValueError when it detects a cycle
+    # Kahn's algorithm: build in-degree counts and adjacency (dependency ->
+    # dependents) in a single pass, including nodes only referenced as deps
+    in_degree: dict[str, int] = {}
+    dependents: dict[str, list[str]] = {}
+
+    for node, deps in dependencies.items():
+        in_degree.setdefault(node, 0)
+        for dep in deps:
+            in_degree.setdefault(dep, 0)
+            dependents.setdefault(dep, []).append(node)
+            in_degree[node] += 1
+
+    queue = deque(node for node, degree in in_degree.items() if degree == 0)
+    result = []
+
+    while queue:
+        node = queue.popleft()
+        result.append(node)
+        for dependent in dependents.get(node, ()):
+            in_degree[dependent] -= 1
+            if in_degree[dependent] == 0:
+                queue.append(dependent)
+
+    if len(result) < len(in_degree):
+        # Remaining nodes with non-zero in-degree form the cyclic
+        # remainder; run Tarjan on that subgraph to name each cycle
+        remaining = {node for node, degree in in_degree.items() if degree > 0}
+        residual = {
+            node: {dep for dep in dependencies.get(node, ()) if dep in remaining}
+            for node in remaining
+        }
+        cycles = _tarjan_scc(residual)
+        details = "; ".join(" -> ".join(cycle) for cycle in cycles)
+        if not details:
+            details = ", ".join(sorted(remaining))
         raise CyclicDependencyError(
-            f"Circular dependency detected in image dependencies: {str(e)}"
-        ) from e
+            f"Circular dependency detected in image dependencies: "
+            f"nodes are in a cycle: {details}"
+        )
+
+    return result
 
 
 def sort_images(images: list) -> list:
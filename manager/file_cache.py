@@ -0,0 +1,88 @@
+"""Persistent file cache for parsed configuration objects.
+
+Caches pickled objects keyed by the source file's (mtime_ns, size) so
+unchanged files can skip expensive parsing on subsequent runs.
+"""
+
+import atexit
+import os
+import pickle
+from pathlib import Path
+
+CACHE_FILE = Path("dist/.cache/configs.pickle")
+
+
+class FileCache:
+    """Disk-backed cache mapping file paths to pickled parsed objects.
+
+    Entries are invalidated when the source file's mtime or size changes.
+    The cache is loaded lazily on first access and flushed to disk once
+    at process exit (only if anything changed).
+    """
+
+    def __init__(self, cache_file: Path = CACHE_FILE):
+        self.cache_file = cache_file
+        self._entries: dict[str, tuple[int, int, bytes]] | None = None
+        self._dirty = False
+
+    def _load(self) -> dict[str, tuple[int, int, bytes]]:
+        """Load cache entries from disk on first access."""
+        if self._entries is None:
+            try:
+                with open(self.cache_file, "rb") as f:
+                    self._entries = pickle.load(f)
+            except Exception:
+                # Missing or corrupt cache file - start fresh
+                self._entries = {}
+        return self._entries
+
+    def get(self, path: Path):
+        """Get the cached object for a file, or None if missing/stale."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        entry = self._load().get(str(path))
+        if entry is None:
+            return None
+
+        mtime_ns, size, payload = entry
+        if mtime_ns != stat.st_mtime_ns or size != stat.st_size:
+            return None
+
+        try:
+            return pickle.loads(payload)
+        except Exception:
+            return None
+
+    def set(self, path: Path, obj) -> None:
+        """Store an object for a file keyed by its current (mtime, size)."""
+        try:
+            stat = os.stat(path)
+            payload = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            # Unpicklable objects or vanished files are simply not cached
+            return
+
+        self._load()[str(path)] = (stat.st_mtime_ns, stat.st_size, payload)
+        self._dirty = True
+
+    def flush(self) -> None:
+        """Write cache entries to disk if anything changed."""
+        if not self._dirty or self._entries is None:
+            return
+
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_file, "wb") as f:
+                pickle.dump(self._entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+            self._dirty = False
+        except Exception:
+            # Cache persistence is best-effort, never fail the run
+            pass
+
+
+# Shared cache for image.yml parsing, flushed once at process exit
+config_cache = FileCache()
+atexit.register(config_cache.flush)
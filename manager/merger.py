@@ -10,7 +10,12 @@ class Merger:
         Example:
             merge({"a": "1"}, {"a": "2"}) -> {"a": "2"}
         """
-        result = {}
+        # Common two-dict case: a single C-level unpack beats the loop
+        if len(dicts) == 2:
+            return {**dicts[0], **dicts[1]}
+
+        result: dict[str, str] = {}
         for d in dicts:
-            result |= d
+            if d:
+                result.update(d)
         return result
@@ -4,12 +4,16 @@ from dataclasses import dataclass, field
 from manager.config import ImageConfig
 from manager.template_resolver import TemplateResolver
 from manager.tag_generator import TagGenerator
-from manager.merger import Merger
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Tag:
-    """Resolved tag with merged versions and variables"""
+    """Resolved tag with merged versions and variables.
+
+    Tags are created in bulk (per image x variant), so they are slotted
+    to drop the per-instance __dict__ and frozen since nothing mutates
+    them after resolution.
+    """
     name: str
     versions: dict[str, str]
     variables: dict[str, str]
@@ -43,6 +47,9 @@ class Image:
     aliases: dict[str, str]
     rootfs_user: str = "0:0"
     rootfs_copy: bool = True
+    # Lookup from variant tag name to its base tag name, precomputed at
+    # resolution time so rendering doesn't rescan tags per variant tag
+    variant_base_tags: dict[str, str] = field(default_factory=dict)
 
     @property
     def root(self) -> Path:
@@ -102,8 +109,10 @@ class ModelResolver:
         # Build base tags with merged data
         base_tags = []
         for tag_config in config.tags:
-            merged_versions = Merger.merge(config.versions, tag_config.versions)
-            merged_variables = Merger.merge(config.variables, tag_config.variables)
+            # Two-layer merges inlined as dict displays — CPython builds
+            # these in C, without the Merger call overhead
+            merged_versions = {**config.versions, **tag_config.versions}
+            merged_variables = {**config.variables, **tag_config.variables}
 
             # Inherit rootfs settings: image -> tag (later wins)
             tag_rootfs_user = tag_config.rootfs_user if tag_config.rootfs_user is not None else (config.rootfs_user or "0:0")
@@ -163,6 +172,15 @@ class ModelResolver:
                 rootfs_copy=variant_rootfs_copy
             ))
 
+        # Precompute variant tag -> base tag mapping for rendering
+        variant_base_tags: dict[str, str] = {}
+        for variant in variants:
+            for variant_tag in variant.tags:
+                for base_tag in base_tags:
+                    if variant_tag.name.startswith(base_tag.name):
+                        variant_base_tags[variant_tag.name] = base_tag.name
+                        break
+
         # Smart name detection
         if config.name:
             # Explicit config always wins
@@ -192,5 +210,6 @@ class ModelResolver:
             extends=config.extends,
             aliases=aliases,  # Use generated aliases instead of config.aliases
             rootfs_user=image_rootfs_user,
-            rootfs_copy=image_rootfs_copy
+            rootfs_copy=image_rootfs_copy,
+            variant_base_tags=variant_base_tags
         )
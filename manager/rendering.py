@@ -1,11 +1,12 @@
+from contextvars import ContextVar
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable
 import os
 import re
 
 from pydantic import dataclasses
-from jinja2 import Environment
+from jinja2 import Environment, Template, pass_context
 from manager.models import Image, Tag, Variant
 
 FONT_STACK = "-apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif"
@@ -94,6 +95,40 @@ def inject_rootfs_copy(dockerfile: str, rootfs_user: str) -> str:
     return "\n".join(result)
 
 
+# Shared Jinja environment - building one per render re-creates the
+# lexer/parser tables for every tag. The filters are registered once as
+# pass_context filters that read the active RenderContext from a
+# ContextVar: pass_context also stops Jinja from constant-folding
+# filter calls on literals (like {{ "name" | resolve_version }}) into
+# the cached compiled template, which would bake the first render's
+# values into every later render of the same source.
+_ENV = Environment()
+
+
+@lru_cache(maxsize=512)
+def _read_template(path_str: str, mtime_ns: int) -> str:
+    """Read a template file once per (path, mtime) combination.
+
+    The mtime key invalidates entries when the file changes on disk.
+    """
+    return Path(path_str).read_text()
+
+
+def _template_source(path: Path) -> str:
+    """Get template source text through the mtime-keyed read cache."""
+    return _read_template(str(path), path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=None)
+def _compile_template(source: str) -> Template:
+    """Compile a template once per unique source text.
+
+    The same template file typically backs many tags, so compilation
+    is cached on the raw source string.
+    """
+    return _ENV.from_string(source)
+
+
 @dataclasses.dataclass(frozen=True)
 class RenderContext:
     image: Image
@@ -104,65 +139,91 @@ class RenderContext:
     has_rootfs: bool = False
 
 
-def _resolve_base_image(ctx: RenderContext) -> Callable[[str], str]:
-    def impl(name: str):
-        found = [i for i in ctx.all if i.name == name and i.is_base_image]
-        if len(found) == 1:
-            base_ref = found[0].full_qualified_base_image_name
-            # Append snapshot_id if provided (for MR/branch builds)
-            if ctx.snapshot_id:
-                base_ref = f"{base_ref}-{ctx.snapshot_id}"
-            return base_ref
-        else:
-            raise RuntimeError(f"Could not resolve base image {name}")
+# RenderContext the filters resolve against, set for the duration of one
+# render call. The base-image index is built lazily per render since the
+# filter may be invoked many times per template.
+_active_context: ContextVar[RenderContext | None] = ContextVar("_active_context", default=None)
+_base_index: ContextVar[dict[str, Image | None] | None] = ContextVar("_base_index", default=None)
 
-    return impl
 
+@pass_context
+def _resolve_base_image(_jinja_ctx, name: str) -> str:
+    ctx = _active_context.get()
+    if ctx is None:
+        raise RuntimeError("resolve_base_image used outside of a render call")
 
-def _resolve_version(ctx: RenderContext) -> Callable[[str], str]:
-    def impl(name: str):
-        # In the new architecture, tags already have merged versions
-        # So we just need to check the tag's versions
-        version_from_tag = ctx.tag.versions.get(name, None)
-        if version_from_tag is not None:
-            return version_from_tag
+    base_index = _base_index.get()
+    if base_index is None:
+        base_index = {}
+        for image in ctx.all:
+            if image.is_base_image:
+                # Duplicate names are ambiguous and must not resolve
+                base_index[image.name] = None if image.name in base_index else image
+        _base_index.set(base_index)
 
-        raise RuntimeError(f"Could not resolve version {name}")
+    found = base_index.get(name)
+    if found is None:
+        raise RuntimeError(f"Could not resolve base image {name}")
 
-    return impl
+    base_ref = found.full_qualified_base_image_name
+    # Append snapshot_id if provided (for MR/branch builds)
+    if ctx.snapshot_id:
+        base_ref = f"{base_ref}-{ctx.snapshot_id}"
+    return base_ref
 
 
-def render_test_config(context: RenderContext) -> str:
-    env = Environment()
-    env.filters["resolve_version"] = _resolve_version(context)
+@pass_context
+def _resolve_version(_jinja_ctx, name: str) -> str:
+    ctx = _active_context.get()
+    if ctx is None:
+        raise RuntimeError("resolve_version used outside of a render call")
 
-    tpl = env.from_string(context.image.test_config_path.read_text())
-    full_qualified_image_name = f"{context.image.name}:{context.tag.name}"
-    if context.variant is not None:
-        full_qualified_image_name += f"-{context.variant.name}"
+    # In the new architecture, tags already have merged versions
+    # So we just need to check the tag's versions
+    version_from_tag = ctx.tag.versions.get(name, None)
+    if version_from_tag is not None:
+        return version_from_tag
 
-    return tpl.render(
-        image=context.image,
-        tag=context.tag,
-        full_qualified_image_name=full_qualified_image_name,
-    )
+    raise RuntimeError(f"Could not resolve version {name}")
 
 
-def render_dockerfile(context: RenderContext):
-    env = Environment()
-    env.filters["resolve_base_image"] = _resolve_base_image(context)
-    env.filters["resolve_version"] = _resolve_version(context)
+_ENV.filters["resolve_base_image"] = _resolve_base_image
+_ENV.filters["resolve_version"] = _resolve_version
 
+
+def render_test_config(context: RenderContext) -> str:
+    ctx_token = _active_context.set(context)
+    index_token = _base_index.set(None)
+    try:
+        tpl = _compile_template(_template_source(context.image.test_config_path))
+        full_qualified_image_name = f"{context.image.name}:{context.tag.name}"
+        if context.variant is not None:
+            full_qualified_image_name += f"-{context.variant.name}"
+
+        return tpl.render(
+            image=context.image,
+            tag=context.tag,
+            full_qualified_image_name=full_qualified_image_name,
+        )
+    finally:
+        _base_index.reset(index_token)
+        _active_context.reset(ctx_token)
+
+
+def render_dockerfile(context: RenderContext):
     variant_args = {}
 
     if context.variant is not None:
         # For variants, need to find the base tag name (without suffix)
         # The variant tag name is like "3.13.7-semantic", we need "3.13.7"
-        base_tag_name = context.tag.name
-        for base_tag in context.image.tags:
-            if context.tag.name.startswith(base_tag.name):
-                base_tag_name = base_tag.name
-                break
+        base_tag_name = context.image.variant_base_tags.get(context.tag.name)
+        if base_tag_name is None:
+            # Fall back to scanning for images built without the index
+            base_tag_name = context.tag.name
+            for base_tag in context.image.tags:
+                if context.tag.name.startswith(base_tag.name):
+                    base_tag_name = base_tag.name
+                    break
 
         variant_args = {
             "base_image": f"{context.image.name}:{base_tag_name}",
@@ -175,8 +236,14 @@ def render_dockerfile(context: RenderContext):
         rootfs_user = context.tag.rootfs_user
         rootfs_copy = context.tag.rootfs_copy
 
-    tpl = env.from_string(tpl_file.read_text())
-    rendered = tpl.render(image=context.image, tag=context.tag, **variant_args)
+    ctx_token = _active_context.set(context)
+    index_token = _base_index.set(None)
+    try:
+        tpl = _compile_template(_template_source(tpl_file))
+        rendered = tpl.render(image=context.image, tag=context.tag, **variant_args)
+    finally:
+        _base_index.reset(index_token)
+        _active_context.reset(ctx_token)
 
     # Inject COPY rootfs/ if conditions are met
     if context.has_rootfs and rootfs_copy:
@@ -1,11 +1,22 @@
 from typing import TYPE_CHECKING
 
 from manager.config import VariantConfig
-from manager.merger import Merger
 
 if TYPE_CHECKING:
     from manager.models import Tag
 
+# Tag is imported lazily (manager.models imports this module), but only
+# once per process instead of once per generate_variant_tags call
+_Tag = None
+
+
+def _get_tag():
+    """Resolve the Tag class on first use, dodging the circular import."""
+    global _Tag
+    if _Tag is None:
+        from manager.models import Tag as _Tag
+    return _Tag
+
 
 class TagGenerator:
     """Generates variant tags from base tags"""
@@ -24,31 +35,31 @@ class TagGenerator:
         - Has merged versions: image → base_tag → variant
         - Has merged variables: image → base_tag → variant
         """
-        # Import at runtime to avoid circular import
-        from manager.models import Tag
+        Tag = _get_tag()
 
-        variant_tags = []
+        # The image and variant layers are loop-invariant; precompute their
+        # merge once. Tags without own overrides share that dict directly —
+        # merged versions/variables are never mutated downstream, so the
+        # aliasing saves one allocation per tag. When a base tag does
+        # override, merge its layer in the middle to keep the
+        # image → base_tag → variant precedence.
+        invariant_versions = {**image_versions, **variant.versions}
+        invariant_variables = {**image_variables, **variant.variables}
+        suffix = variant.tag_suffix
 
-        for base_tag in base_tags:
-            # Create suffixed name
-            variant_tag_name = base_tag.name + variant.tag_suffix
-
-            # Merge versions: image → base_tag → variant
-            merged_versions = Merger.merge(
-                image_versions, base_tag.versions, variant.versions
+        return [
+            Tag(
+                name=base_tag.name + suffix,
+                versions=(
+                    {**image_versions, **base_tag.versions, **variant.versions}
+                    if base_tag.versions
+                    else invariant_versions
+                ),
+                variables=(
+                    {**image_variables, **base_tag.variables, **variant.variables}
+                    if base_tag.variables
+                    else invariant_variables
+                ),
             )
-
-            # Merge variables: image → base_tag → variant
-            merged_variables = Merger.merge(
-                image_variables, base_tag.variables, variant.variables
-            )
-
-            variant_tags.append(
-                Tag(
-                    name=variant_tag_name,
-                    versions=merged_versions,
-                    variables=merged_variables,
-                )
-            )
-
-        return variant_tags
+            for base_tag in base_tags
+        ]
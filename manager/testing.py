@@ -1,41 +1,107 @@
 """Wrapper for container-structure-test binary."""
 
+import atexit
+import logging
 import os
 import platform
+import shlex
+import socket
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import docker
-from docker.errors import NotFound, APIError
+if TYPE_CHECKING:
+    import docker
 
 # Docker-in-Docker container for isolated testing
 DIND_CONTAINER_NAME = "image-manager-dind"
 DIND_PORT = 2375
 DIND_IMAGE = "docker:dind"
 
+logger = logging.getLogger(__name__)
 
-def get_host_client() -> docker.DockerClient:
-    """Get Docker client for the host daemon."""
-    return docker.from_env()
+# docker-py (and the requests/urllib3 stack it drags in) is imported on
+# first use only, so CLI commands that never touch Docker don't pay its
+# import cost at startup
+_docker = None
 
 
-def get_dind_client() -> docker.DockerClient:
-    """Get Docker client for the dind daemon."""
-    return docker.DockerClient(base_url=f"tcp://127.0.0.1:{DIND_PORT}")
+def _lazy_docker():
+    """Import docker-py on first use and cache the module."""
+    global _docker
+    if _docker is None:
+        import docker as _docker
+    return _docker
+
+
+@lru_cache(maxsize=1)
+def get_host_client() -> "docker.DockerClient":
+    """Get Docker client for the host daemon.
+
+    The client (and its urllib3 connection pool) is created once per
+    process and closed at exit.
+    """
+    client = _lazy_docker().from_env()
+    atexit.register(client.close)
+    return client
+
+
+@lru_cache(maxsize=1)
+def get_dind_client() -> "docker.DockerClient":
+    """Get Docker client for the dind daemon.
+
+    The client (and its urllib3 connection pool) is created once per
+    process and closed at exit.
+    """
+    from requests.adapters import HTTPAdapter
+
+    client = _lazy_docker().DockerClient(base_url=f"tcp://127.0.0.1:{DIND_PORT}")
+    # Widen the urllib3 pool beyond the default 10 non-blocking slots so
+    # parallel test workers reuse keep-alive sockets instead of opening a
+    # fresh TCP connection per request
+    client.api.mount(
+        "http://",
+        HTTPAdapter(pool_connections=32, pool_maxsize=32, pool_block=True),
+    )
+    atexit.register(client.close)
+    return client
+
+
+# Last dind status check as (monotonic timestamp, running) — the
+# ensure_dind -> start_dind chain probes several times back to back and
+# only the first round-trip is worth paying
+_dind_status: tuple[float, bool] | None = None
+_DIND_STATUS_TTL = 0.5
 
 
 def is_dind_running() -> bool:
-    """Check if the dind container is running."""
+    """Check if the dind container is running.
+
+    A filtered list call is used instead of containers.get: one HTTP
+    round-trip and an empty result instead of a NotFound exception when
+    the container is absent. The answer is cached briefly so repeated
+    probes during startup reuse it.
+    """
+    global _dind_status
+    now = time.monotonic()
+    if _dind_status is not None and now - _dind_status[0] < _DIND_STATUS_TTL:
+        return _dind_status[1]
+
     try:
         client = get_host_client()
-        container = client.containers.get(DIND_CONTAINER_NAME)
-        return container.status == "running"
-    except NotFound:
-        return False
+        containers = client.containers.list(
+            all=True, filters={"name": f"^{DIND_CONTAINER_NAME}$"}
+        )
+        running = any(c.status == "running" for c in containers)
     except Exception:
-        return False
+        running = False
+
+    _dind_status = (now, running)
+    return running
 
 
 def start_dind() -> int:
@@ -44,6 +110,8 @@ def start_dind() -> int:
     On Linux: Tries to run with minimal capabilities (SYS_ADMIN, NET_ADMIN, MKNOD).
     On macOS: Uses privileged mode as Docker Desktop's VM has cgroup limitations.
     """
+    from docker.errors import NotFound, APIError
+
     if is_dind_running():
         print("dind container is already running")
         return 0
@@ -104,16 +172,26 @@ def start_dind() -> int:
             print(f"Failed to start dind container: {e}", file=sys.stderr)
             return 1
 
-    # Wait for Docker daemon inside dind to be ready
-    print("Waiting for Docker daemon to be ready...")
-    for _ in range(60):  # 30 second timeout
+    # Wait for Docker daemon inside dind to be ready. Poll with exponential
+    # backoff (25ms..500ms) so a fast daemon is detected almost immediately,
+    # and probe the TCP port with a cheap raw connect before paying for a
+    # full HTTP ping through the docker client.
+    logger.debug("Waiting for Docker daemon to be ready...")
+    deadline = time.monotonic() + 30
+    delay = 0.025
+    while time.monotonic() < deadline:
         try:
+            with socket.create_connection(("127.0.0.1", DIND_PORT), timeout=delay):
+                pass
             dind = get_dind_client()
             dind.ping()
+            global _dind_status
+            _dind_status = None
             print(f"dind container started (addr: tcp://127.0.0.1:{DIND_PORT})")
             return 0
         except Exception:
-            time.sleep(0.5)
+            time.sleep(delay)
+            delay = min(delay * 1.5, 0.5)
 
     print("Timeout waiting for dind container", file=sys.stderr)
     return 1
@@ -121,6 +199,10 @@ def start_dind() -> int:
 
 def stop_dind() -> int:
     """Stop the dind container."""
+    from docker.errors import NotFound
+
+    global _dind_status
+    _dind_status = None
     try:
         client = get_host_client()
         container = client.containers.get(DIND_CONTAINER_NAME)
@@ -146,8 +228,23 @@ def get_docker_host() -> str:
     return f"tcp://127.0.0.1:{DIND_PORT}"
 
 
+@lru_cache(maxsize=1)
+def _test_env() -> dict[str, str]:
+    """Environment for test subprocesses, built once per process.
+
+    Copying os.environ per spawn adds up in batch runs; the augmented
+    dict is shared since nothing mutates it.
+    """
+    return {**os.environ, "DOCKER_HOST": get_docker_host()}
+
+
+@lru_cache(maxsize=1)
 def get_bin_path() -> Path:
-    """Get the path to the bin directory for the current platform."""
+    """Get the path to the bin directory for the current platform.
+
+    Platform detection and the existence check run once per process;
+    the resolved path is cached afterwards.
+    """
     system = platform.system().lower()
     machine = platform.machine().lower()
 
@@ -168,8 +265,9 @@ def get_bin_path() -> Path:
     return bin_path
 
 
+@lru_cache(maxsize=1)
 def get_container_structure_test_path() -> Path:
-    """Get the path to the container-structure-test binary."""
+    """Get the path to the container-structure-test binary (cached)."""
     binary = get_bin_path() / "container-structure-test"
     if not binary.exists():
         raise RuntimeError(f"container-structure-test binary not found: {binary}")
@@ -225,22 +323,123 @@ def find_image_tar(image_ref: str) -> Path:
     return tar_path
 
 
-def load_image_tar(tar_path: Path) -> bool:
+def find_artifacts(
+    image_refs: list[str],
+    config_paths: dict[str, Path] | None = None,
+) -> dict[str, tuple[Path, Path]]:
+    """Locate the test config and image tar for many refs in one pass.
+
+    Instead of two stat calls per ref, each dist/<name>/<tag> directory
+    is read once with os.scandir and both artifacts are picked out of the
+    single directory listing.
+
+    Args:
+        image_refs: Image references in format 'name:tag'
+        config_paths: Optional explicit test configs per ref; refs listed
+                      here don't need a generated test.yml
+
+    Returns:
+        Mapping of image ref to (test config path, image tar path)
+
+    Raises:
+        FileNotFoundError: If a test config or image tar is missing
+    """
+    artifacts = {}
+    config_paths = config_paths or {}
+    for image_ref in image_refs:
+        dist_path = get_dist_path(image_ref)
+        explicit_config = config_paths.get(image_ref)
+        found = {}
+        try:
+            with os.scandir(dist_path) as entries:
+                for entry in entries:
+                    if entry.name in ("test.yml", "image.tar"):
+                        found[entry.name] = Path(entry.path)
+        except FileNotFoundError:
+            pass
+
+        if explicit_config is None and "test.yml" not in found:
+            raise FileNotFoundError(
+                f"Test config not found: {dist_path / 'test.yml'}\n"
+                f"Run 'uv run image-manager' first to generate test configs."
+            )
+        if "image.tar" not in found:
+            raise FileNotFoundError(
+                f"Image tar not found: {dist_path / 'image.tar'}\n"
+                f"Run 'uv run build-image {image_ref}' first to build the image."
+            )
+
+        artifacts[image_ref] = (explicit_config or found["test.yml"], found["image.tar"])
+
+    return artifacts
+
+
+def _iter_file(f, chunk_size: int = 1 << 20):
+    """Yield fixed-size chunks from an open binary file."""
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _image_already_loaded(tar_path: Path, image_ref: str) -> bool:
+    """Check whether dind already holds the image from this tar.
+
+    A .loaded marker next to the tar records the last successful load;
+    the load can only be skipped if the tar has not been rebuilt since
+    (marker at least as new as the tar) and the daemon still reports the
+    reference — dind may have been recreated in between.
+    """
+    marker = tar_path.with_name(".loaded")
+    try:
+        if marker.stat().st_mtime_ns < tar_path.stat().st_mtime_ns:
+            return False
+    except OSError:
+        return False
+
+    try:
+        dind = get_dind_client()
+        return bool(dind.images.list(filters={"reference": image_ref}))
+    except Exception:
+        return False
+
+
+def load_image_tar(tar_path: Path, image_ref: str | None = None) -> bool:
     """Load an image tar into the dind Docker daemon.
 
+    The tar is streamed to the daemon in 1 MiB chunks so memory usage
+    stays flat regardless of archive size. When the image ref is known,
+    a tar that was already loaded into the running daemon is skipped
+    entirely.
+
     Args:
         tar_path: Path to the image tar file
+        image_ref: Optional image reference used to detect an earlier
+                   load of the same tar
 
     Returns:
         True if successful, False otherwise
     """
-    print(f"Loading image from {tar_path}...")
+    if image_ref is not None and _image_already_loaded(tar_path, image_ref):
+        logger.debug("Image %s already loaded, skipping %s", image_ref, tar_path)
+        return True
+
+    logger.debug("Loading image from %s...", tar_path)
     try:
         dind = get_dind_client()
         with open(tar_path, "rb") as f:
-            images = dind.images.load(f)
+            if hasattr(os, "posix_fadvise"):
+                # Tell the kernel we read sequentially so it prefetches
+                # aggressively and can drop pages behind us
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            images = dind.images.load(_iter_file(f))
         for img in images:
-            print(f"Loaded: {img.tags}")
+            logger.debug("Loaded: %s", img.tags)
+        try:
+            tar_path.with_name(".loaded").touch()
+        except OSError:
+            pass
         return True
     except Exception as e:
         print(f"Failed to load image: {e}", file=sys.stderr)
@@ -276,7 +475,7 @@ def run_test(
     tar_path = find_image_tar(image_ref)
 
     # Load image into dind Docker
-    if not load_image_tar(tar_path):
+    if not load_image_tar(tar_path, image_ref):
         return 1
 
     binary = get_container_structure_test_path()
@@ -289,11 +488,137 @@ def run_test(
         "--config", str(config_path),
     ]
 
-    print(f"Running: DOCKER_HOST={docker_host} {' '.join(cmd)}")
-    result = subprocess.run(cmd, env={**os.environ, "DOCKER_HOST": docker_host})
+    logger.debug("Running: DOCKER_HOST=%s %s", docker_host, shlex.join(cmd))
+    result = subprocess.run(cmd, env=_test_env())
     return result.returncode
 
 
+def load_image_tars(
+    tar_paths: list[Path],
+    concurrency: int = 4,
+    image_refs: list[str] | None = None,
+) -> list[bool]:
+    """Load several image tars into dind in parallel.
+
+    Each upload is I/O-bound on the socket write and dockerd's untar, so
+    a small thread pool overlaps the upload of one tar with the untar of
+    another. Concurrency is bounded to avoid saturating the daemon; the
+    shared dind client's pool has enough sockets for the workers.
+
+    Args:
+        tar_paths: Paths to the image tar files
+        concurrency: Maximum number of parallel uploads
+        image_refs: Optional image references matching tar_paths, used to
+                    skip tars the daemon already has loaded
+
+    Returns:
+        Per-tar success flags, in the same order as tar_paths
+    """
+    if not tar_paths:
+        return []
+
+    refs = image_refs or [None] * len(tar_paths)
+    if len(tar_paths) == 1:
+        return [load_image_tar(tar_paths[0], refs[0])]
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(tar_paths))) as pool:
+        return list(pool.map(load_image_tar, tar_paths, refs))
+
+
+def run_tests(
+    image_refs: list[str],
+    config_paths: dict[str, Path] | None = None,
+) -> int:
+    """Run container-structure-test for multiple images in one batch.
+
+    Starts dind once, loads every image tar up front with the cached
+    client, then runs the test subprocesses in parallel — each one is
+    I/O-bound on the dind daemon, not on the local CPU. Failures are
+    isolated per image: refs with missing artifacts or a failed tar load
+    go into the failure summary and the remaining refs still get tested.
+
+    Args:
+        image_refs: Image references in format 'name:tag'
+        config_paths: Optional mapping of image ref to explicit test config.
+                      Missing entries fall back to dist/<name>/<tag>/test.yml
+
+    Returns:
+        0 if all tests passed, highest exit code otherwise
+    """
+    if not image_refs:
+        return 0
+
+    if not ensure_dind():
+        print("Error: Failed to start dind container", file=sys.stderr)
+        return 1
+
+    # Resolve artifacts per ref so one unbuilt tag doesn't abort the
+    # whole batch — the refs under images/ are not guaranteed to all
+    # have been built into dist/
+    configs = {}
+    tar_paths = {}
+    failed = []
+    for image_ref in image_refs:
+        try:
+            config, tar_path = find_artifacts([image_ref], config_paths)[image_ref]
+            configs[image_ref] = config
+            tar_paths[image_ref] = tar_path
+        except FileNotFoundError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            failed.append(image_ref)
+
+    testable = list(tar_paths)
+    loaded = load_image_tars([tar_paths[ref] for ref in testable], image_refs=testable)
+
+    to_test = []
+    for image_ref, ok in zip(testable, loaded):
+        if ok:
+            to_test.append(image_ref)
+        else:
+            failed.append(image_ref)
+
+    binary = get_container_structure_test_path()
+    docker_host = get_docker_host()
+    env = _test_env()
+
+    def run_one(image_ref: str) -> subprocess.CompletedProcess:
+        cmd = [
+            str(binary),
+            "test",
+            "--image", image_ref,
+            "--config", str(configs[image_ref]),
+        ]
+        logger.debug("Running: DOCKER_HOST=%s %s", docker_host, shlex.join(cmd))
+        return subprocess.run(cmd, env=env, capture_output=True, text=True)
+
+    # Capture each test's output and print it per image as futures
+    # complete, so concurrent runs don't interleave line-by-line —
+    # same pattern as the render warnings collected per worker
+    results = {}
+    if to_test:
+        with ThreadPoolExecutor(max_workers=min(len(to_test), os.cpu_count() or 1)) as pool:
+            futures = {pool.submit(run_one, image_ref): image_ref for image_ref in to_test}
+            for future in as_completed(futures):
+                image_ref = futures[future]
+                result = future.result()
+                print(f"\n{'='*60}")
+                print(f"Testing {image_ref}")
+                print(f"{'='*60}")
+                if result.stdout:
+                    print(result.stdout, end="")
+                if result.stderr:
+                    print(result.stderr, end="", file=sys.stderr)
+                results[image_ref] = result.returncode
+
+    failed.extend(image_ref for image_ref, code in results.items() if code != 0)
+    if failed:
+        print(f"\nFailed tests: {', '.join(failed)}", file=sys.stderr)
+        return max([code for code in results.values() if code != 0] + [1])
+
+    print(f"\nAll {len(image_refs)} image(s) passed tests")
+    return 0
+
+
 def main() -> None:
     """CLI entrypoint for test-image command."""
     from manager.cli import CLI
@@ -320,8 +645,31 @@ def main() -> None:
     config_path = Path(opts["config"]) if "config" in opts else None
 
     try:
-        exit_code = run_test(image_ref, config_path)
-        sys.exit(exit_code)
+        if not ensure_dind():
+            print("Error: Failed to start dind container", file=sys.stderr)
+            sys.exit(1)
+
+        if config_path is None:
+            config_path = find_test_config(image_ref)
+
+        if not load_image_tar(find_image_tar(image_ref), image_ref):
+            sys.exit(1)
+
+        binary = get_container_structure_test_path()
+        docker_host = get_docker_host()
+
+        cmd = [
+            str(binary),
+            "test",
+            "--image", image_ref,
+            "--config", str(config_path),
+        ]
+
+        logger.debug("Running: DOCKER_HOST=%s %s", docker_host, shlex.join(cmd))
+        # Nothing happens after the tests finish, so replace this process
+        # with the test binary instead of forking a child and waiting on
+        # it — the interpreter's memory is freed for the test's duration
+        os.execvpe(cmd[0], cmd, _test_env())
     except (RuntimeError, FileNotFoundError, ValueError) as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
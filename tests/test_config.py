@@ -3,7 +3,7 @@ import tempfile
 from pathlib import Path
 from unittest.mock import patch
 import pytest
-from manager.config import ImageConfig, TagConfig, VariantConfig, ConfigLoader, expand_env_vars, load_config, get_registry_url, get_registry_auth, clear_config_cache
+from manager.config import ImageConfig, TagConfig, VariantConfig, ConfigLoader, expand_env_vars, load_config, get_registry_url, get_registry_auth, get_registry_auth_for, clear_config_cache
 
 
 class TestExpandEnvVars:
@@ -306,3 +306,52 @@ class TestGetRegistryAuth:
         monkeypatch.delenv("MISSING_PASS", raising=False)
 
         assert get_registry_auth() is None
+
+
+class TestGetRegistryAuthFor:
+    def setup_method(self):
+        """Clear cache before each test."""
+        clear_config_cache()
+
+    def test_exact_host_match(self, tmp_path, monkeypatch):
+        """Returns credentials for refs under a registry's host."""
+        config_file = tmp_path / ".image-manager.yml"
+        config_file.write_text(
+            "registries:\n"
+            "  - url: ghcr.io\n"
+            "    username: user\n"
+            "    password: pass\n"
+        )
+        monkeypatch.chdir(tmp_path)
+
+        assert get_registry_auth_for("ghcr.io/myorg/myimage") == ("user", "pass")
+
+    def test_shared_host_prefers_namespace_scoped_registry(self, tmp_path, monkeypatch):
+        """Namespace-scoped credentials win over bare-host ones on a shared host."""
+        config_file = tmp_path / ".image-manager.yml"
+        config_file.write_text(
+            "registries:\n"
+            "  - url: registry.example.com/team\n"
+            "    username: teamuser\n"
+            "    password: teampass\n"
+            "  - url: registry.example.com\n"
+            "    username: baseuser\n"
+            "    password: basepass\n"
+        )
+        monkeypatch.chdir(tmp_path)
+
+        assert get_registry_auth_for("registry.example.com/team/img") == ("teamuser", "teampass")
+        assert get_registry_auth_for("registry.example.com/other/img") == ("baseuser", "basepass")
+
+    def test_no_match_returns_none(self, tmp_path, monkeypatch):
+        """Returns None for hosts no registry is configured for."""
+        config_file = tmp_path / ".image-manager.yml"
+        config_file.write_text(
+            "registries:\n"
+            "  - url: ghcr.io\n"
+            "    username: user\n"
+            "    password: pass\n"
+        )
+        monkeypatch.chdir(tmp_path)
+
+        assert get_registry_auth_for("docker.io/library/ubuntu") is None
@@ -0,0 +1,54 @@
+from manager.file_cache import FileCache
+
+
+def test_get_returns_none_on_miss(tmp_path):
+    """Test cache miss returns None"""
+    cache = FileCache(cache_file=tmp_path / "cache.pickle")
+    source = tmp_path / "image.yml"
+    source.write_text("name: test")
+
+    assert cache.get(source) is None
+
+
+def test_set_then_get_returns_object(tmp_path):
+    """Test cached object round-trips through pickle"""
+    cache = FileCache(cache_file=tmp_path / "cache.pickle")
+    source = tmp_path / "image.yml"
+    source.write_text("name: test")
+
+    cache.set(source, {"name": "test"})
+
+    assert cache.get(source) == {"name": "test"}
+
+
+def test_get_invalidates_on_change(tmp_path):
+    """Test changing the source file invalidates the entry"""
+    cache = FileCache(cache_file=tmp_path / "cache.pickle")
+    source = tmp_path / "image.yml"
+    source.write_text("name: test")
+
+    cache.set(source, {"name": "test"})
+    source.write_text("name: changed-content")
+
+    assert cache.get(source) is None
+
+
+def test_flush_persists_entries(tmp_path):
+    """Test flushed cache is readable by a fresh instance"""
+    cache_file = tmp_path / "cache.pickle"
+    source = tmp_path / "image.yml"
+    source.write_text("name: test")
+
+    cache = FileCache(cache_file=cache_file)
+    cache.set(source, {"name": "test"})
+    cache.flush()
+
+    fresh = FileCache(cache_file=cache_file)
+    assert fresh.get(source) == {"name": "test"}
+
+
+def test_get_returns_none_for_missing_file(tmp_path):
+    """Test missing source file returns None instead of raising"""
+    cache = FileCache(cache_file=tmp_path / "cache.pickle")
+
+    assert cache.get(tmp_path / "does-not-exist.yml") is None
@@ -1,5 +1,7 @@
 """Tests for the generate command with rootfs integration."""
 
+import os
+import time
 from pathlib import Path
 
 
@@ -136,3 +138,113 @@ variants:
     assert variant_rootfs.exists()
     assert (variant_rootfs / "etc" / "base.conf").read_text() == "base-config"
     assert (variant_rootfs / "etc" / "variant.conf").read_text() == "variant-config"
+
+
+def _make_image(root: Path, name: str, extends: str | None = None) -> Path:
+    """Create a minimal image directory under images/<name>/1/."""
+    image_dir = root / "images" / name / "1"
+    image_dir.mkdir(parents=True)
+
+    config = f"name: {name}\n"
+    if extends:
+        config += f"extends: {extends}\n"
+    config += 'tags:\n  - name: "1.0"\n'
+    (image_dir / "image.yml").write_text(config)
+    (image_dir / "Dockerfile.jinja2").write_text("FROM base:1.0\nRUN echo hello")
+    (image_dir / "test.yml.jinja2").write_text("schemaVersion: '2.0.0'")
+
+    return image_dir
+
+
+def test_generate_skips_up_to_date_images(tmp_path, monkeypatch, capsys):
+    """Test that a second generate run skips images with fresh outputs"""
+    _make_image(tmp_path, "test")
+    (tmp_path / "dist").mkdir()
+    monkeypatch.chdir(tmp_path)
+
+    from manager.__main__ import cmd_generate
+    assert cmd_generate([]) == 0
+
+    dockerfile = tmp_path / "dist" / "test" / "1.0" / "Dockerfile"
+    first_mtime = dockerfile.stat().st_mtime_ns
+
+    capsys.readouterr()
+    assert cmd_generate([]) == 0
+
+    assert "Skipping 1 up-to-date image(s)" in capsys.readouterr().out
+    assert dockerfile.stat().st_mtime_ns == first_mtime
+
+
+def test_generate_rerenders_dependents_of_changed_image(tmp_path, monkeypatch):
+    """Test that touching an upstream config re-renders its dependents"""
+    _make_image(tmp_path, "parent")
+    _make_image(tmp_path, "child", extends="parent")
+    (tmp_path / "dist").mkdir()
+    monkeypatch.chdir(tmp_path)
+
+    from manager.__main__ import cmd_generate
+    assert cmd_generate([]) == 0
+
+    child_dockerfile = tmp_path / "dist" / "child" / "1.0" / "Dockerfile"
+    first_mtime = child_dockerfile.stat().st_mtime_ns
+
+    # Make the parent config newer than all rendered outputs; the child's
+    # own sources are untouched, so only dependency propagation can
+    # mark it stale
+    parent_yml = tmp_path / "images" / "parent" / "1" / "image.yml"
+    future = time.time_ns() + 5_000_000_000
+    os.utime(parent_yml, ns=(future, future))
+
+    assert cmd_generate([]) == 0
+    assert child_dockerfile.stat().st_mtime_ns > first_mtime
+
+
+def test_generate_force_regenerates(tmp_path, monkeypatch, capsys):
+    """Test that --force re-renders even when outputs are up-to-date"""
+    _make_image(tmp_path, "test")
+    (tmp_path / "dist").mkdir()
+    monkeypatch.chdir(tmp_path)
+
+    from manager.__main__ import cmd_generate
+    assert cmd_generate([]) == 0
+
+    dockerfile = tmp_path / "dist" / "test" / "1.0" / "Dockerfile"
+    first_mtime = dockerfile.stat().st_mtime_ns
+
+    capsys.readouterr()
+    assert cmd_generate(["--force"]) == 0
+
+    assert "Skipping" not in capsys.readouterr().out
+    assert dockerfile.stat().st_mtime_ns > first_mtime
+
+
+def test_generate_rerenders_when_parameters_change(tmp_path, monkeypatch, capsys):
+    """Test that changed render parameters invalidate up-to-date outputs
+
+    A snapshot run bakes the id into rendered refs without touching any
+    source file, so a following plain run must not trust output mtimes.
+    """
+    _make_image(tmp_path, "test")
+    (tmp_path / "dist").mkdir()
+    monkeypatch.chdir(tmp_path)
+
+    from manager.__main__ import cmd_generate
+    assert cmd_generate(["--snapshot-id", "mr42"]) == 0
+
+    dockerfile = tmp_path / "dist" / "test" / "1.0" / "Dockerfile"
+    first_mtime = dockerfile.stat().st_mtime_ns
+
+    capsys.readouterr()
+    assert cmd_generate([]) == 0
+    assert "Skipping" not in capsys.readouterr().out
+    assert dockerfile.stat().st_mtime_ns > first_mtime
+
+    # Same parameters again: the stamp matches and the skip applies
+    second_mtime = dockerfile.stat().st_mtime_ns
+    assert cmd_generate([]) == 0
+    assert "Skipping 1 up-to-date image(s)" in capsys.readouterr().out
+    assert dockerfile.stat().st_mtime_ns == second_mtime
+
+    # Toggling the lock mode changes rendered content the same way
+    assert cmd_generate(["--no-lock"]) == 0
+    assert "Skipping" not in capsys.readouterr().out
@@ -186,3 +186,36 @@ RUN echo hello
     assert lines[0] == "ARG BASE_IMAGE=base:1.0"
     assert lines[1] == "FROM ${BASE_IMAGE}"
     assert lines[2] == "COPY --chown=0:0 rootfs/ /"
+
+
+def test_render_dockerfile_resolves_versions_per_tag(tmp_path):
+    """Test that tags sharing a template each get their own versions
+
+    The compiled template is cached per source, so a literal filter call
+    like {{ "python" | resolve_version }} must not be constant-folded
+    with the first tag's value.
+    """
+    tpl = tmp_path / "Dockerfile.tmpl"
+    tpl.write_text('FROM python:{{ "python" | resolve_version }}\nRUN echo hello')
+
+    tag_312 = Tag(name="3.12", versions={"python": "3.12.1"}, variables={})
+    tag_313 = Tag(name="3.13", versions={"python": "3.13.0"}, variables={})
+
+    image = Image(
+        name="python",
+        path=tmp_path,
+        template_path=tpl,
+        versions={},
+        variables={},
+        tags=[tag_312, tag_313],
+        variants=[],
+        is_base_image=False,
+        extends=None,
+        aliases={},
+    )
+
+    first = render_dockerfile(RenderContext(image=image, tag=tag_312, all=[]))
+    second = render_dockerfile(RenderContext(image=image, tag=tag_313, all=[]))
+
+    assert "FROM python:3.12.1" in first
+    assert "FROM python:3.13.0" in second